@@ -0,0 +1,38 @@
+"""
+Optional build step compiling the Cython traversal core.
+
+The package works without the extension, so a missing Cython or compiler only skips it.
+"""
+
+from typing import Any
+
+from setuptools import Extension
+from setuptools.command.build_ext import build_ext
+
+
+class OptionalBuildExt(build_ext):
+    def run(self) -> None:
+        try:
+            super().run()
+        except Exception as e:
+            print(f"Skipping the compiled traversal core: {e}")
+
+    def build_extension(self, ext: Extension) -> None:
+        try:
+            super().build_extension(ext)
+        except Exception as e:
+            print(f"Skipping {ext.name}: {e}")
+
+
+def build(setup_kwargs: Any) -> None:
+    try:
+        from Cython.Build import cythonize
+    except ImportError:
+        return
+
+    setup_kwargs.update(
+        {
+            "ext_modules": cythonize([Extension("jsonpath_object._core", ["jsonpath_object/_core.pyx"])]),
+            "cmdclass": {"build_ext": OptionalBuildExt},
+        }
+    )
@@ -0,0 +1,11 @@
+from typing import Any, Callable, Optional, Tuple
+
+def traverse(
+    steps: Tuple[Tuple[str, int], ...],
+    raise_on_missing: bool,
+    path: Any,
+    missing: Any,
+    list_types: frozenset,
+    data: Any,
+    factory: Optional[Callable[[], Any]],
+) -> Any: ...
@@ -0,0 +1,69 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Compiled traversal for paths without a default factory.
+
+This mirrors the pure Python walker built by ``jsonpath_object.core._build_walker`` and is used in its place when the
+extension is available.
+"""
+
+from cpython.dict cimport PyDict_GetItem
+from cpython.list cimport PyList_GET_ITEM, PyList_GET_SIZE
+from cpython.ref cimport PyObject
+
+
+cpdef object traverse(
+    tuple steps,
+    bint raise_on_missing,
+    object path,
+    object missing,
+    frozenset list_types,
+    object data,
+    object factory,
+):
+    """
+    Follow prebuilt ``(key, index)`` steps from the root data.
+
+    :param steps: The ``(key, index)`` steps of the path.
+    :param raise_on_missing: Whether to raise an exception when an item is not found.
+    :param path: The original path, used in error messages.
+    :param missing: The value returned when the item is not found and raise_on_missing is off.
+    :param list_types: The exact types handled as lists.
+    :param data: The root data.
+    :param factory: Unused, accepted for signature compatibility with the Python walkers.
+    :return: The item, or ``missing``.
+    """
+    cdef object current = data
+    cdef object key
+    cdef Py_ssize_t index
+    cdef PyObject *found
+
+    for key, index in steps:
+        if index >= 0 and type(current) is list:
+            if index < PyList_GET_SIZE(current):
+                current = <object>PyList_GET_ITEM(current, index)
+                continue
+        elif type(current) is dict:
+            found = PyDict_GetItem(current, key)
+            if found is not NULL:
+                current = <object>found
+                continue
+        elif index >= 0 and (type(current) in list_types or isinstance(current, list)):
+            if index < len(current):
+                current = current[index]
+                continue
+        else:
+            try:
+                if key in current:
+                    current = current[key]
+                    continue
+            except TypeError:
+                # The path runs into a value that cannot be indexed further, like a number.
+                pass
+
+        if not raise_on_missing:
+            return missing
+        if index >= 0 and (type(current) in list_types or isinstance(current, list)):
+            raise IndexError(f"Index {index} out of range for list.")
+        raise KeyError(path)
+
+    return current
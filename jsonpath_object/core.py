@@ -1,29 +1,301 @@
 from __future__ import annotations
 
+import sys
+from collections import deque
+from functools import lru_cache, partial
 from typing import (
     Any,
     Callable,
+    Deque,
     Iterable,
+    Iterator,
     Mapping,
     MutableMapping,
+    MutableSequence,
     Optional,
     Sequence,
+    Tuple,
     Union,
     overload,
 )
 
+try:
+    from ._core import traverse as _traverse
+except ImportError:
+    _traverse = None  # type: ignore[assignment]
+
+_Step = Tuple[str, int]
+
+
+def _parse_key(key: str) -> _Step:
+    # Interned keys let dict lookups and inserts match stored keys by identity instead of comparing characters.
+    # isdigit() also accepts characters like "²" that int() rejects, so only decimal keys are parsed as indices.
+    # Indices are capped to fit a C ssize_t for the compiled core; no list is that long anyway.
+    return sys.intern(key), min(int(key), sys.maxsize) if key.isdecimal() else -1
+
+
+@lru_cache(maxsize=4096)
+def _split_path(path: str) -> tuple[_Step, ...]:
+    """
+    Split a dot-separated path into ``(key, index)`` steps.
+
+    ``index`` is the key parsed as a list index, or ``-1`` for keys that can only address a mapping.
+    The result is cached so repeated access to the same path skips re-parsing it.
+
+    :param path: The dot-separated path.
+    :return: The steps of the path.
+    """
+    return tuple(_parse_key(k) for k in path.split("."))
+
+
+class _MissingType:
+    """
+    The type of the _MISSING sentinel, which stays the same object when copied or pickled.
+    """
+
+    __slots__ = ()
+
+    def __reduce__(self) -> str:
+        return "_MISSING"
+
+    def __repr__(self) -> str:
+        return "<missing>"
+
+
+_MISSING = _MissingType()
+
+_SCALARS = frozenset({str, int, float, bool, type(None)})
+
+
+def _intern_keys(data: Any) -> None:
+    """
+    Replace the string keys of every dict in the data with their interned copy, in place.
+
+    Keys are re-inserted in their original order, so iteration order is preserved.
+
+    :param data: The data to update.
+    """
+    stack = [data]
+    while stack:
+        obj = stack.pop()
+        while isinstance(obj, BaseJsonPath):
+            obj = obj.data
+        if isinstance(obj, dict):
+            items = [(sys.intern(key) if type(key) is str else key, value) for key, value in obj.items()]
+            # Refilling the cleared dict reuses its table; popping and re-inserting keys one by one would resize it.
+            obj.clear()
+            obj.update(items)
+            stack.extend(value for _, value in items if type(value) not in _SCALARS)
+        elif isinstance(obj, list):
+            stack.extend(value for value in obj if type(value) not in _SCALARS)
+
+
+_Walker = Callable[[Any, Optional[Callable[[], Any]]], Any]
+
+
+def _build_walker(path: Any, steps: Sequence[_Step], raise_on_missing: bool, has_factory: bool) -> _Walker:
+    """
+    Build a traversal function for a fixed path.
+
+    All key parsing happens before this point, so the returned function only has to follow the prebuilt steps.
+
+    :param path: The original path, used in error messages.
+    :param steps: The ``(key, index)`` steps of the path.
+    :param raise_on_missing: Whether to raise an exception when an item is not found.
+    :param has_factory: Whether missing items are created with a default factory.
+    :return: A function taking the root data and the default factory and returning the item, or ``_MISSING``
+        when the item is not found and neither raising nor a default factory applies.
+    """
+    steps = tuple(steps)
+    last = len(steps) - 1
+
+    if has_factory:
+        # The container created at each step to hold the next one: a list when the next key is an index.
+        templates = tuple(list if index >= 0 else dict for _, index in steps[1:])
+        # Lists created along the way start empty, so any index but 0 after the first missing step is out of range.
+        last_skipping = max((i for i, (_, index) in enumerate(steps) if index > 0), default=-1)
+
+        def vivify(current: Any, start: int, factory: Callable[[], Any]) -> Any:
+            # Everything from ``start`` onwards is missing, so the rest of the path is built without lookups.
+            # All checks run before anything is created, so a bad index leaves the data untouched.
+            is_list = type(current) in _LIST_TYPES or isinstance(current, list)
+            index = steps[start][1]
+            if index >= 0 and is_list and index != len(current):
+                raise IndexError(f"Index {index} out of range for list.")
+            if last_skipping > start:
+                raise IndexError(f"Index {steps[last_skipping][1]} out of range for list.")
+
+            for i in range(start, last + 1):
+                k, index = steps[i]
+                child = factory() if i == last else templates[i]()
+                if index >= 0 and is_list:
+                    current.append(child)
+                    if type(current) is _ColumnarList:
+                        # The record is stored column-wise, so continue through its stored view.
+                        child = current[index]
+                else:
+                    current[k] = child
+                current = child
+                # The templates create a list wherever the next key is an index.
+                is_list = True
+            return current
+
+        def walk_with_factory(data: Any, factory: Optional[Callable[[], Any]]) -> Any:
+            current = data
+            for i, (k, index) in enumerate(steps):
+                if index >= 0 and (type(current) in _LIST_TYPES or isinstance(current, list)):
+                    if index < len(current):
+                        current = current[index]
+                        continue
+                elif type(current) is dict:
+                    try:
+                        current = current[k]
+                        continue
+                    except KeyError:
+                        pass
+                else:
+                    # Other mappings may fill in missing keys on lookup (defaultdict), so test membership first.
+                    try:
+                        if k in current:
+                            current = current[k]
+                            continue
+                    except TypeError:
+                        pass
+                return vivify(current, i, factory)  # type: ignore[arg-type]
+            return current
+
+        return walk_with_factory
+
+    if _traverse is not None:
+        # The compiled core implements the same walk without the per-step bytecode.
+        return partial(_traverse, steps, raise_on_missing, path, _MISSING, _LIST_TYPES)
+
+    # Hits are the common case, so the raising walker indexes plain dicts straight away and lets them report a
+    # miss: one lookup per step instead of a membership test followed by a lookup. Other mappings may fill in
+    # missing keys on lookup (defaultdict), so they get the membership test.
+    def walk_or_raise(data: Any, factory: Optional[Callable[[], Any]]) -> Any:
+        current = data
+        for k, index in steps:
+            if index >= 0 and (type(current) in _LIST_TYPES or isinstance(current, list)):
+                if index < len(current):
+                    current = current[index]
+                    continue
+                raise IndexError(f"Index {index} out of range for list.")
+            if type(current) is dict:
+                try:
+                    current = current[k]
+                    continue
+                except KeyError:
+                    pass
+            else:
+                try:
+                    if k in current:
+                        current = current[k]
+                        continue
+                except TypeError:
+                    # The path runs into a value that cannot be indexed further, like a number.
+                    pass
+            raise KeyError(path)
+        return current
+
+    # Misses are expected here (get, membership tests), so they are detected without raising.
+    def walk_or_missing(data: Any, factory: Optional[Callable[[], Any]]) -> Any:
+        current = data
+        try:
+            for k, index in steps:
+                if index >= 0 and (type(current) in _LIST_TYPES or isinstance(current, list)):
+                    if index < len(current):
+                        current = current[index]
+                        continue
+                elif k in current:
+                    current = current[k]
+                    continue
+                return _MISSING
+        except TypeError:
+            # The path runs into a value that cannot be indexed further, like a number.
+            return _MISSING
+        return current
+
+    return walk_or_raise if raise_on_missing else walk_or_missing
+
+
+@lru_cache(maxsize=4096)
+def _compile(path: str, raise_on_missing: bool, has_factory: bool) -> _Walker:
+    """
+    Compile a dot-separated path into a cached traversal function.
+
+    :param path: The dot-separated path.
+    :param raise_on_missing: Whether to raise an exception when an item is not found.
+    :param has_factory: Whether missing items are created with a default factory.
+    :return: A function taking the root data and the default factory and returning the item.
+    """
+    return _build_walker(path, _split_path(path), raise_on_missing, has_factory)
+
+
+def _build_parent_walker(steps: Sequence[_Step], raise_on_missing: bool) -> _Walker:
+    """
+    Build a function following a path to the container of an item being set, creating missing mappings on the way.
+
+    Missing keys always get a new dict, even when they look like list indices, so numeric keys such as IDs can be
+    set on mappings. An index out of range of an existing list raises, or is skipped when raise_on_missing is off.
+
+    :param steps: The ``(key, index)`` steps of the path to the container.
+    :param raise_on_missing: Whether to raise an exception when a list index is out of range.
+    :return: A function taking the root data and the (unused) default factory and returning the container.
+    """
+
+    def walk_and_create(data: Any, factory: Optional[Callable[[], Any]]) -> Any:
+        current = data
+        for k, index in steps:
+            if index >= 0 and (type(current) in _LIST_TYPES or isinstance(current, list)):
+                if index < len(current):
+                    current = current[index]
+                elif raise_on_missing:
+                    raise IndexError(f"Index {index} out of range for list.")
+                continue
+            if type(current) is dict:
+                try:
+                    current = current[k]
+                    continue
+                except KeyError:
+                    pass
+            elif isinstance(current, Mapping) and k in current:
+                current = current[k]
+                continue
+            child: dict = {}
+            current[k] = child
+            current = child
+        return current
+
+    return walk_and_create
+
+
+@lru_cache(maxsize=4096)
+def _compile_parent(path: str, raise_on_missing: bool) -> _Walker:
+    """
+    Compile a dot-separated path into a cached function reaching the container of an item being set.
+
+    :param path: The dot-separated path to the container.
+    :param raise_on_missing: Whether to raise an exception when a list index is out of range.
+    :return: A function taking the root data and the (unused) default factory and returning the container.
+    """
+    return _build_parent_walker(_split_path(path), raise_on_missing)
+
 
 class BaseJsonPath:
     """
     A class representing a mapping for JSON-like data with support for dot-separated keys.
     """
 
+    __slots__ = ("data", "default_factory", "raise_on_missing", "_root", "_repr")
+
     def __init__(
         self,
         data: Union[None, Mapping, Sequence, BaseJsonPath] = None,
         *,
         raise_on_missing: bool = True,
         default_factory: Optional[Callable[[], Any]] = None,
+        intern_keys: bool = False,
     ) -> None:
         """
         Initialize the _JsonPathMapping instance.
@@ -31,6 +303,8 @@ class BaseJsonPath:
         :param data: The initial data for the mapping.
         :param raise_on_missing: Whether to raise an exception when an item is not found.
         :param default_factory: A callable used to create default values for missing items.
+        :param intern_keys: Whether to intern the string keys of the data, so that many objects sharing the same
+            schema also share a single copy of every key.
         """
         if data and isinstance(data, BaseJsonPath):
             self.default_factory: Optional[Callable[[], Any]] = data.default_factory
@@ -40,25 +314,71 @@ class BaseJsonPath:
             self.raise_on_missing = raise_on_missing
         if data is None:
             data = {}
+        elif intern_keys:
+            _intern_keys(data)
         self.data = data
+        self._root: Optional[BaseJsonPath] = None
+        self._repr: Optional[str] = None
 
     def __contains__(self, item: Any) -> bool:
+        """
+        Check whether a key, or an item at a dot-separated JSON path, exists.
+
+        :param item: The key or JSON path to the item.
+        :return: Whether the item exists.
+        """
+        if isinstance(item, str) and "." in item:
+            return _compile(item, False, False)(self.data, None) is not _MISSING
         return item in self.data
 
     def __str__(self) -> str:
-        return str(self.to_object())
+        return self.__repr__()
 
     def __repr__(self) -> str:
-        return repr(self.to_object())
+        # Nested objects share their data with the object they came from and with each other, so only the top-level
+        # object, which every change made through them reaches, caches its representation.
+        if self._root is not None:
+            return repr(self.to_object())
+        if self._repr is None:
+            self._repr = repr(self.to_object())
+        return self._repr
 
     def __len__(self) -> int:
         return len(self.data)
 
     def __iter__(self) -> Any:
+        # Iteration, items() and values() hand out the stored containers themselves, which may then be changed.
+        self._invalidate()
         return iter(self.data)
 
-    def __getattr__(self, item: str) -> Any:
-        return getattr(self.data, item)
+    def keys(self) -> Any:
+        return self.data.keys()  # type: ignore[union-attr]
+
+    def items(self) -> Any:
+        self._invalidate()
+        return self.data.items()  # type: ignore[union-attr]
+
+    def values(self) -> Any:
+        self._invalidate()
+        return self.data.values()  # type: ignore[union-attr]
+
+    def get(self, key: Union[int, str, Sequence[str]], default: Any = None) -> Any:
+        """
+        Get an item by key or JSON path, or a default when it is missing.
+
+        Misses do not raise and are not filled in by the default factory, which makes this cheaper than catching
+        the KeyError or IndexError raised by item access.
+
+        :param key: The key or JSON path to the item.
+        :param default: The value returned when the item is missing.
+        :return: The item, or the default.
+        """
+        value = self._get_walker(key, raise_on_missing=False, has_factory=False)(self.data, None)
+        return default if value is _MISSING else value
+
+    def append(self, value: Any) -> None:
+        self.data.append(value)  # type: ignore[union-attr]
+        self._invalidate()
 
     @overload
     def __getitem__(self, item: int) -> Any:
@@ -79,48 +399,58 @@ class BaseJsonPath:
         :param key: The key or JSON path to the item.
         :return: The item.
         """
-        keys = self._get_keys(key)
-        current_dict = self.data
+        data = self.data
+        # A plain key on a dict needs no path parsing at all.
+        if type(key) is str and type(data) is dict and "." not in key:
+            try:
+                return data[key]
+            except KeyError:
+                pass
+        if self.default_factory is not None:
+            self._invalidate()
+        value = self._get_walker(key)(data, self.default_factory)
+        return None if value is _MISSING else value
+
+    def compact(self, key: Union[int, str, Sequence[str]]) -> None:
+        """
+        Store the list of records at a key or JSON path column-wise.
 
-        for i, k in enumerate(keys):
-            if k.isdigit() and isinstance(current_dict, (list, _JsonPathList)):
-                index = int(k)
-                if 0 <= index < len(current_dict):
-                    current_dict = current_dict[index]
-                else:
-                    if self.default_factory:
-                        if keys[-1] == k:
-                            current_dict.append(self.default_factory())
-                            return current_dict[int(k)]
-                        if keys[i + 1].isdigit():
-                            current_dict.append([])
-                        else:
-                            current_dict.append({})
-                        current_dict = current_dict[int(k)]
-                    elif self.raise_on_missing:
-                        raise IndexError(f"Index {index} out of range for list.")
-
-            elif k in current_dict:
-                current_dict = current_dict[k]  # type: ignore[call-overload]
-            else:
-                if self.default_factory:
-                    if keys[-1] == k:
-                        current_dict[k] = self.default_factory()  # type: ignore[index]
-                        return current_dict[k]  # type: ignore[call-overload]
-                    if keys[i + 1].isdigit():
-                        current_dict[k] = _JsonPathList([])  # type: ignore[index]
-                    else:
-                        current_dict[k] = _JsonPathDict({})  # type: ignore[index]
-                    current_dict = current_dict[k]  # type: ignore[call-overload]
-                elif self.raise_on_missing:
-                    raise KeyError(key)
-
-        if isinstance(current_dict, dict):
-            return _JsonPathDict(current_dict)
-        elif isinstance(current_dict, list):
-            return _JsonPathList(current_dict)
-        else:
-            return current_dict
+        Each field gets a single list holding its value for every record, instead of one dict per record, which
+        takes far less memory for long lists of records sharing the same fields. The records stay accessible and
+        mutable through paths as before; records missing a field simply leave a gap in that field's column.
+
+        The list is no longer a plain ``list`` afterwards, so ``json.dumps(obj.data)`` fails on it; use
+        ``to_object()`` to get plain JSON data back.
+
+        :param key: The key or JSON path to a list of mappings.
+        """
+        current_dict, last_key = self._find(key, create=False)
+        records = current_dict[last_key]
+        if isinstance(records, _ColumnarList):
+            return
+        if not isinstance(records, Sequence) or isinstance(records, str):
+            raise TypeError(f"Only lists of records can be stored column-wise, not {type(records).__name__}.")
+        for row in records:
+            _ColumnarList._check_row(row)
+        current_dict[last_key] = _ColumnarList(records)
+        self._invalidate()
+
+    def bulk_get(self, keys: Iterable[Union[int, str, Sequence[str]]]) -> list:
+        """
+        Get several items by key or JSON path in one call.
+
+        Every path is resolved to its cached traversal function up front, so the lookups themselves run
+        back to back without any per-item dispatch.
+
+        :param keys: The keys or JSON paths to the items.
+        :return: The items, in the order of the keys.
+        """
+        walkers = [self._get_walker(key) for key in keys]
+        if self.default_factory is not None:
+            self._invalidate()
+        data, factory = self.data, self.default_factory
+        values = [walker(data, factory) for walker in walkers]
+        return [None if value is _MISSING else value for value in values]
 
     def __setitem__(self, key: Union[int, str, Sequence[str]], value: Any) -> None:
         """
@@ -131,6 +461,7 @@ class BaseJsonPath:
         """
         current_dict, last_key = self._find(key)
         current_dict[last_key] = value
+        self._invalidate()
 
     def __delitem__(self, key: Union[int, str, Sequence[str]]) -> None:
         """
@@ -138,8 +469,9 @@ class BaseJsonPath:
 
         :param key: The key or JSON path to the item.
         """
-        current_dict, last_key = self._find(key)
+        current_dict, last_key = self._find(key, create=False)
         del current_dict[last_key]
+        self._invalidate()
 
     def __eq__(self, other: Any) -> bool:
         if isinstance(other, BaseJsonPath):
@@ -152,34 +484,102 @@ class BaseJsonPath:
     def __ne__(self, other: Any) -> bool:
         return not self.__eq__(other)
 
-    def _find(self, key: Union[int, str, Iterable]) -> tuple:
-        keys = self._get_keys(key)
-        current_dict = self.data
-        for k in keys[:-1]:
-            if k.isdigit() and isinstance(current_dict, list):
-                index = int(k)
-                if 0 <= index < len(current_dict):
-                    current_dict = current_dict[index]
-                else:
-                    if self.raise_on_missing:
-                        raise IndexError(f"Index {index} out of range for list.")
-            elif isinstance(current_dict, MutableMapping):
-                if k in current_dict:
-                    current_dict = current_dict[k]
+    @classmethod
+    def _wrap_fast(
+        cls, data: Union[Mapping, Sequence], raise_on_missing: bool, default_factory: Optional[Callable[[], Any]]
+    ) -> Any:
+        """
+        Wrap data known to be a container, skipping the argument handling of __init__.
+
+        :param data: The data to wrap.
+        :param raise_on_missing: Whether to raise an exception when an item is not found.
+        :param default_factory: A callable used to create default values for missing items.
+        :return: The new instance.
+        """
+        obj = cls.__new__(cls)
+        obj.data = data
+        obj.raise_on_missing = raise_on_missing
+        obj.default_factory = default_factory
+        obj._root = None
+        obj._repr = None
+        return obj
+
+    def _invalidate(self) -> None:
+        """
+        Drop the cached representation of the top-level object this object was taken from.
+
+        Changes made to the data without going through a JsonPathObject are not tracked.
+        """
+        root = self if self._root is None else self._root
+        root._repr = None
+
+    def _find(self, key: Union[int, str, Iterable], create: bool = True) -> tuple:
+        """
+        Find the container holding the item addressed by a key or JSON path.
+
+        :param key: The key or JSON path to the item.
+        :param create: Whether to create missing intermediate containers instead of raising.
+        :return: The container and the key of the item within it.
+        """
+        if isinstance(key, int):
+            key = str(key)
+        walker: Optional[_Walker] = None
+        if isinstance(key, str):
+            parent_path, _, last_key = key.rpartition(".")
+            last_key = sys.intern(last_key)
+            if parent_path:
+                walker = (
+                    _compile_parent(parent_path, self.raise_on_missing)
+                    if create
+                    else _compile(parent_path, True, False)
+                )
+        else:
+            steps = self._get_path(key)
+            last_key = steps[-1][0]
+            if len(steps) > 1:
+                if create:
+                    walker = _build_parent_walker(steps[:-1], self.raise_on_missing)
                 else:
-                    current_dict[k] = {}
-                    current_dict = current_dict[k]
-        last_key: Union[str, int] = keys[-1]
-        if isinstance(current_dict, list):
-            last_key = int(last_key)
+                    walker = _build_walker(key, steps[:-1], True, False)
+
+        current_dict = walker(self.data, None) if walker else self.data
+        if type(current_dict) in _LIST_TYPES or isinstance(current_dict, list):
+            return current_dict, int(last_key)
         return current_dict, last_key
 
+    def _get_walker(
+        self,
+        key: Union[int, str, Iterable],
+        raise_on_missing: Optional[bool] = None,
+        has_factory: Optional[bool] = None,
+    ) -> _Walker:
+        if raise_on_missing is None:
+            raise_on_missing = self.raise_on_missing
+        if has_factory is None:
+            has_factory = self.default_factory is not None
+        if isinstance(key, int):
+            key = str(key)
+        if isinstance(key, str):
+            return _compile(key, raise_on_missing, has_factory)
+        return _build_walker(key, self._get_path(key), raise_on_missing, has_factory)
+
+    @staticmethod
+    def _get_path(key: Union[int, str, Iterable]) -> Sequence[_Step]:
+        if isinstance(key, int):
+            return _split_path(str(key))
+        elif isinstance(key, str):
+            return _split_path(key)
+        elif isinstance(key, Sequence):
+            return tuple(_parse_key(k) for k in key)
+        else:
+            raise NotImplementedError()
+
     @staticmethod
     def _get_keys(key: Union[int, str, Iterable]) -> list[str]:
         if isinstance(key, int):
             keys = [str(key)]
         elif isinstance(key, str):
-            keys = key.split(".")
+            keys = [k for k, _ in _split_path(key)]
         elif isinstance(key, Sequence):
             keys = list(key)
         else:
@@ -189,37 +589,287 @@ class BaseJsonPath:
 
     def to_object(self) -> Any:
         """
-        Recursively converts _JsonPathDict and _JsonPathList instances to dict and list.
+        Converts _JsonPathDict and _JsonPathList instances to dict and list.
+
+        The conversion walks the data with an explicit stack, so deeply nested data does not hit the recursion
+        limit.
 
         :return: The converted object.
         """
-
-        def convert(obj):
-            if isinstance(obj, Mapping):
-                return {key: convert(value) for key, value in obj.items()}
-            elif isinstance(obj, (Sequence, Iterable)) and not isinstance(obj, str):
-                return [convert(item) for item in obj]
+        root: list = [None]
+        stack: list = [(self.data, root, 0)]
+
+        while stack:
+            obj, parent, key = stack.pop()
+            while isinstance(obj, BaseJsonPath):
+                obj = obj.data
+
+            obj_type = type(obj)
+            if obj_type in _SCALARS:
+                parent[key] = obj
+                continue
+
+            if obj_type is dict or (obj_type is not list and isinstance(obj, Mapping)):
+                converted: Any = dict(obj.items())
+                children: Iterable = converted.items()
+            elif obj_type is list or (isinstance(obj, Iterable) and not isinstance(obj, str)):
+                converted = list(obj)
+                children = enumerate(converted)
             else:
-                return obj
+                parent[key] = obj
+                continue
+
+            parent[key] = converted
+            stack.extend((value, converted, k) for k, value in children if type(value) not in _SCALARS)
 
-        return convert(self.data)
+        return root[0]
 
 
-class _JsonPathDict(BaseJsonPath, Mapping):
-    pass
+# The wrappers implement the container protocols themselves and are only registered with the ABCs, which keeps
+# their MRO short for every dunder lookup.
+class _JsonPathDict(BaseJsonPath):
+    __slots__ = ()
 
 
-class _JsonPathList(BaseJsonPath, Sequence):
+class _JsonPathList(BaseJsonPath):
+    __slots__ = ()
+
     def __getitem__(self, item):
         return super().__getitem__(item)
 
+    def __reversed__(self) -> Iterator:
+        return reversed(self.data)  # type: ignore[arg-type]
+
+    def index(self, value: Any, *args: Any) -> int:
+        return self.data.index(value, *args)  # type: ignore[union-attr]
+
+    def count(self, value: Any) -> int:
+        return self.data.count(value)  # type: ignore[union-attr]
+
+
+Mapping.register(_JsonPathDict)
+Sequence.register(_JsonPathList)
+
+
+class _ColumnarList(MutableSequence):
+    """
+    A list of records stored column-wise, with one list of values per field.
+
+    Records are exposed as _ColumnarRow views. A field missing from a record holds _MISSING in its column.
+    """
+
+    __slots__ = ("_columns", "_length")
+
+    def __init__(self, rows: Sequence[Mapping] = ()) -> None:
+        fields = dict.fromkeys(field for row in rows for field in row)
+        self._columns: dict = {field: [row.get(field, _MISSING) for row in rows] for field in fields}
+        self._length = len(rows)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:  # type: ignore[override]
+        if isinstance(index, slice):
+            sliced = _ColumnarList()
+            sliced._columns = {field: column[index] for field, column in self._columns.items()}
+            sliced._length = len(range(*index.indices(self._length)))
+            return sliced
+        return _ColumnarRow(self, self._normalize_index(index))
+
+    def __setitem__(self, index: Union[int, slice], row: Any) -> None:  # type: ignore[override]
+        if isinstance(index, slice):
+            # Copy the records first: they may be views of this very list.
+            rows = [dict(item) if isinstance(item, Mapping) else item for item in row]
+            for item in rows:
+                self._check_row(item)
+            replaced = len(range(*index.indices(self._length)))
+            if index.step not in (None, 1) and replaced != len(rows):
+                raise ValueError(f"attempt to assign sequence of size {len(rows)} to extended slice of size {replaced}")
+            for item in rows:
+                self._add_fields(item)
+            for field, column in self._columns.items():
+                column[index] = [item.get(field, _MISSING) for item in rows]
+            self._length += len(rows) - replaced
+            return
+        index = self._normalize_index(index)
+        self._check_row(row)
+        self._add_fields(row)
+        for field, column in self._columns.items():
+            column[index] = row.get(field, _MISSING)
+
+    def __delitem__(self, index: Union[int, slice]) -> None:  # type: ignore[override]
+        if isinstance(index, slice):
+            removed = len(range(*index.indices(self._length)))
+            for column in self._columns.values():
+                del column[index]
+            self._length -= removed
+            return
+        index = self._normalize_index(index)
+        for column in self._columns.values():
+            del column[index]
+        self._length -= 1
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, Sequence) and not isinstance(other, str):
+            return len(self) == len(other) and all(row == other_row for row, other_row in zip(self, other))
+        return False
+
+    def __repr__(self) -> str:
+        return repr([dict(row) for row in self])
+
+    def pop(self, index: int = -1) -> dict:  # type: ignore[override]
+        # A view would point at the next record once this one is deleted, so return a copy instead.
+        row = dict(self[index])
+        del self[index]
+        return row
+
+    def reverse(self) -> None:
+        for column in self._columns.values():
+            column.reverse()
+
+    def insert(self, index: int, row: Mapping) -> None:
+        self._check_row(row)
+        self._add_fields(row)
+        index = max(0, min(index + self._length if index < 0 else index, self._length))
+        for field, column in self._columns.items():
+            column.insert(index, row.get(field, _MISSING))
+        self._length += 1
+
+    def _add_fields(self, fields: Iterable) -> None:
+        for field in fields:
+            if field not in self._columns:
+                self._columns[field] = [_MISSING] * self._length
+
+    def _normalize_index(self, index: int) -> int:
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError(f"Index {index} out of range for list.")
+        return index
+
+    @staticmethod
+    def _check_row(row: Any) -> None:
+        if not isinstance(row, Mapping):
+            raise TypeError(f"Records stored column-wise must be mappings, not {type(row).__name__}.")
+
+
+class _ColumnarRow(MutableMapping):
+    """
+    A view of one record of a _ColumnarList.
+
+    The view is positional: deleting or inserting records before it shifts the record it points to.
+    """
+
+    __slots__ = ("_records", "_index")
+
+    def __init__(self, records: _ColumnarList, index: int) -> None:
+        self._records = records
+        self._index = index
+
+    def __getitem__(self, field: Any) -> Any:
+        value = self._records._columns[field][self._index]
+        if value is _MISSING:
+            raise KeyError(field)
+        return value
+
+    def __setitem__(self, field: Any, value: Any) -> None:
+        self._records._add_fields((field,))
+        self._records._columns[field][self._index] = value
+
+    def __delitem__(self, field: Any) -> None:
+        column = self._records._columns.get(field)
+        if column is None or column[self._index] is _MISSING:
+            raise KeyError(field)
+        column[self._index] = _MISSING
+
+    def __iter__(self) -> Iterator:
+        index = self._index
+        return (field for field, column in self._records._columns.items() if column[index] is not _MISSING)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
 
 class JsonPathObject(BaseJsonPath):
+    __slots__ = ()
+
     def __getitem__(self, key: Union[int, str, Sequence[str]]) -> Any:
-        value = super().__getitem__(key)
-        if isinstance(value, Mapping):
-            return JsonPathObject(value)
-        elif isinstance(value, Sequence) and not isinstance(value, str):
-            return JsonPathObject(value)
+        return self._wrap(super().__getitem__(key))
+
+    def bulk_get(self, keys: Iterable[Union[int, str, Sequence[str]]]) -> list:
+        return [self._wrap(value) for value in super().bulk_get(keys)]
+
+    def get(self, key: Union[int, str, Sequence[str]], default: Any = None) -> Any:
+        value = super().get(key, _MISSING)
+        return default if value is _MISSING else self._wrap(value)
+
+    def _wrap(self, value: Any) -> Any:
+        """
+        Wrap a container found in the data, sharing this object's missing-item behavior.
+
+        :param value: The value to wrap.
+        :return: A JsonPathObject for mappings and sequences, the value itself otherwise.
+        """
+        value_type = type(value)
+        if value_type in _SCALARS or isinstance(value, JsonPathObject):
+            return value
+        elif (
+            value_type in _DICT_TYPES
+            or value_type in _LIST_TYPES
+            or isinstance(value, Mapping)
+            or (isinstance(value, Sequence) and not isinstance(value, str))
+        ):
+            return JsonPathObject._acquire(value, self)
         else:
             return value
+
+    @classmethod
+    def _acquire(cls, data: Any, parent: BaseJsonPath) -> JsonPathObject:
+        """
+        Get a nested object for data found under a parent, reusing a released object when one is available.
+
+        :param data: The data to wrap.
+        :param parent: The object the data was taken from.
+        :return: The nested object, tied to the top-level object of the parent.
+        """
+        try:
+            obj = _WRAPPER_POOL.pop()
+        except IndexError:
+            obj = cls._wrap_fast(data, parent.raise_on_missing, parent.default_factory)
+        else:
+            obj.data = data
+            obj.raise_on_missing = parent.raise_on_missing
+            obj.default_factory = parent.default_factory
+        obj._root = parent if parent._root is None else parent._root
+        return obj
+
+    def _release(self) -> None:
+        """
+        Hand this nested object back for reuse by later lookups. It must not be used afterwards.
+
+        Top-level objects are never released, and releasing an object twice does nothing.
+        """
+        if self._root is None:
+            return
+        self.data = None  # type: ignore[assignment]
+        self.default_factory = None
+        self._root = None
+        self._repr = None
+        _WRAPPER_POOL.append(self)
+
+    def __enter__(self) -> JsonPathObject:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self._release()
+
+
+# Released nested objects waiting to be reused by _acquire.
+_WRAPPER_POOL: Deque[JsonPathObject] = deque(maxlen=64)
+
+# Exact-type lookups for the common containers; anything else falls back to an isinstance check.
+_DICT_TYPES = frozenset({dict, _JsonPathDict})
+_LIST_TYPES = frozenset({list, _JsonPathList, _ColumnarList})
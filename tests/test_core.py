@@ -1,3 +1,10 @@
+import copy
+import json
+import pickle
+import sys
+from collections import OrderedDict, defaultdict
+from collections.abc import Mapping, Sequence
+
 import pytest
 
 from jsonpath_object import JsonPathObject
@@ -255,3 +262,485 @@ def test_delete_note_existing():
 
     with pytest.raises(IndexError):
         del jsonpath_data["scores.10"]
+
+
+def test_get_path():
+    steps = JsonPathObject._get_path("nested_lists.0.name")
+    assert list(steps) == [("nested_lists", -1), ("0", 0), ("name", -1)]
+
+    assert JsonPathObject._get_path("foo.bar") is JsonPathObject._get_path("foo.bar")
+
+
+def test_non_decimal_digit_keys():
+    custom_dict = JsonPathObject({"a": {"²": 1, "①": 2}})
+
+    assert custom_dict["a.²"] == 1
+    assert custom_dict["a.①"] == 2
+    custom_dict["a.³"] = 3
+    assert custom_dict.to_object() == {"a": {"²": 1, "①": 2, "³": 3}}
+
+
+def test_missing_without_raise():
+    custom_dict = JsonPathObject({"address": {"city": "New York"}}, raise_on_missing=False)
+
+    assert custom_dict["missing_key"] is None
+    assert custom_dict["address.missing_key"] is None
+
+
+def test_default_factory_repeated_key():
+    custom_dict = JsonPathObject(default_factory=lambda: "default_value")
+
+    assert custom_dict["a.a"] == "default_value"
+    assert custom_dict.to_object() == {"a": {"a": "default_value"}}
+
+
+def test_to_object_nested():
+    data = {"outer": {"inner": [1, {"value": (2, 3)}]}, "wrapped": JsonPathObject({"key": "value"})}
+    custom_dict = JsonPathObject(data)
+
+    assert custom_dict.to_object() == {"outer": {"inner": [1, {"value": [2, 3]}]}, "wrapped": {"key": "value"}}
+    assert list(custom_dict.to_object()) == ["outer", "wrapped"]
+
+
+def test_to_object_deeply_nested():
+    data: dict = {}
+    current = data
+    for _ in range(5000):
+        current["child"] = {}
+        current = current["child"]
+
+    converted = JsonPathObject(data).to_object()
+    depth = 0
+    while converted:
+        assert isinstance(converted, dict)
+        converted = converted["child"]
+        depth += 1
+    assert depth == 5000
+
+
+def test_forwarded_methods():
+    custom_dict = JsonPathObject({"name": "John", "tags": ["a"]})
+
+    assert list(custom_dict.keys()) == ["name", "tags"]
+    assert list(custom_dict.items()) == [("name", "John"), ("tags", ["a"])]
+    assert list(custom_dict.values()) == ["John", ["a"]]
+    assert custom_dict.get("missing", "default") == "default"
+
+    tags = custom_dict["tags"]
+    tags.append("b")
+    assert custom_dict["tags.1"] == "b"
+
+    assert not hasattr(custom_dict, "__dict__")
+    with pytest.raises(AttributeError):
+        custom_dict.update
+
+
+def test_nested_instance_shares_data():
+    data = {"address": {"city": "New York"}}
+    custom_dict = JsonPathObject(data, raise_on_missing=False)
+
+    address = custom_dict["address"]
+    assert address.data is data["address"]
+    assert address.raise_on_missing is False
+    assert address["missing_key"] is None
+
+    address["city"] = "Los Angeles"
+    assert custom_dict["address.city"] == "Los Angeles"
+
+
+def test_set_creates_nested_containers():
+    custom_dict = JsonPathObject()
+
+    custom_dict["a.b.0"] = "value"
+    custom_dict["a.users.1001.name"] = "Alice"
+    custom_dict[["a", "dotted.key"]] = 1
+    assert custom_dict.to_object() == {
+        "a": {"b": {"0": "value"}, "users": {"1001": {"name": "Alice"}}, "dotted.key": 1}
+    }
+
+
+def test_set_numeric_key_under_missing_parent():
+    custom_dict = JsonPathObject()
+    custom_dict["x.3.y"] = 1
+    assert custom_dict.to_object() == {"x": {"3": {"y": 1}}}
+
+    custom_dict = JsonPathObject({"items": [{"name": "Alice"}]}, raise_on_missing=False)
+    custom_dict["items.0.tags.0"] = "admin"
+    assert custom_dict.to_object() == {"items": [{"name": "Alice", "tags": {"0": "admin"}}]}
+
+
+def test_delete_missing_nested_item():
+    custom_dict = JsonPathObject({"a": {}})
+
+    with pytest.raises(KeyError):
+        del custom_dict["a.b.c"]
+    assert custom_dict.to_object() == {"a": {}}
+
+
+def test_bulk_get():
+    custom_dict = JsonPathObject({"name": "John", "address": {"city": "New York"}, "scores": [85, 90]})
+
+    name, city, score, address = custom_dict.bulk_get(["name", "address.city", "scores.1", "address"])
+    assert (name, city, score) == ("John", "New York", 90)
+    assert isinstance(address, JsonPathObject)
+
+    with pytest.raises(KeyError):
+        custom_dict.bulk_get(["name", "missing_key"])
+
+
+def test_intern_keys():
+    first = JsonPathObject(json.loads('{"user": {"first_name": "John"}, "tags": [{"label": "a"}]}'), intern_keys=True)
+    second = JsonPathObject(json.loads('{"user": {"first_name": "Jane"}, "tags": [{"label": "b"}]}'), intern_keys=True)
+
+    assert first.to_object() == {"user": {"first_name": "John"}, "tags": [{"label": "a"}]}
+    first_key = next(iter(first["user"]))
+    second_key = next(iter(second["user"]))
+    assert first_key is second_key
+    assert next(iter(first["tags.0"])) is next(iter(second["tags.0"]))
+
+
+def test_intern_keys_keeps_dict_size():
+    data = json.loads('{"a": 1, "b": 2, "c": {"d": 3, "e": 4, "f": 5}}')
+    sizes = sys.getsizeof(data), sys.getsizeof(data["c"])
+
+    JsonPathObject(data, intern_keys=True)
+    assert (sys.getsizeof(data), sys.getsizeof(data["c"])) == sizes
+    assert list(data) == ["a", "b", "c"]
+
+
+def test_repr_cache_invalidation():
+    custom_dict = JsonPathObject({"address": {"city": "New York"}, "scores": [85]})
+    assert str(custom_dict) == "{'address': {'city': 'New York'}, 'scores': [85]}"
+
+    custom_dict["address.city"] = "Los Angeles"
+    assert repr(custom_dict) == "{'address': {'city': 'Los Angeles'}, 'scores': [85]}"
+
+    custom_dict["address"]["zip_code"] = "90001"
+    custom_dict["scores"].append(90)
+    assert str(custom_dict) == "{'address': {'city': 'Los Angeles', 'zip_code': '90001'}, 'scores': [85, 90]}"
+
+    del custom_dict["address"]
+    assert repr(custom_dict) == "{'scores': [85, 90]}"
+
+
+def test_repr_cache_default_factory():
+    custom_dict = JsonPathObject(default_factory=lambda: 0)
+    assert repr(custom_dict) == "{}"
+
+    custom_dict["count"]
+    assert repr(custom_dict) == "{'count': 0}"
+
+
+def test_repr_of_nested_instance_after_parent_change():
+    custom_dict = JsonPathObject({"address": {"city": "New York"}})
+    address = custom_dict["address"]
+    sibling = custom_dict["address"]
+    assert repr(address) == "{'city': 'New York'}"
+    assert repr(sibling) == "{'city': 'New York'}"
+
+    custom_dict["address.city"] = "Los Angeles"
+    assert repr(address) == "{'city': 'Los Angeles'}"
+
+    address["zip_code"] = "90001"
+    assert repr(sibling) == "{'city': 'Los Angeles', 'zip_code': '90001'}"
+
+
+def test_repr_after_changes_through_iteration():
+    custom_dict = JsonPathObject({"people": [{"age": 30}], "address": {"city": "New York"}})
+    assert str(custom_dict) == "{'people': [{'age': 30}], 'address': {'city': 'New York'}}"
+
+    for person in custom_dict["people"]:
+        person["age"] += 1
+    assert str(custom_dict) == "{'people': [{'age': 31}], 'address': {'city': 'New York'}}"
+
+    for key, value in custom_dict.items():
+        if key == "address":
+            value["city"] = "Los Angeles"
+    assert str(custom_dict) == "{'people': [{'age': 31}], 'address': {'city': 'Los Angeles'}}"
+
+    for value in custom_dict.values():
+        if isinstance(value, list):
+            value.append({"age": 20})
+    assert str(custom_dict) == "{'people': [{'age': 31}, {'age': 20}], 'address': {'city': 'Los Angeles'}}"
+
+
+def test_get_with_default():
+    custom_dict = JsonPathObject({"address": {"city": "New York", "zip_code": None}, "scores": [85, 90]})
+
+    assert custom_dict.get("address.city") == "New York"
+    assert custom_dict.get("address.zip_code", "default") is None
+    assert custom_dict.get("address.country") is None
+    assert custom_dict.get("address.country", "unknown") == "unknown"
+    assert custom_dict.get("scores.5", -1) == -1
+    assert custom_dict.get(["scores", "1"]) == 90
+    assert isinstance(custom_dict.get("address"), JsonPathObject)
+
+
+def test_get_does_not_use_default_factory():
+    custom_dict = JsonPathObject(default_factory=lambda: "default_value")
+
+    assert custom_dict.get("missing_key") is None
+    assert "missing_key" not in custom_dict
+
+
+def test_container_subclasses():
+    class Records(list):
+        pass
+
+    custom_dict = JsonPathObject(OrderedDict(records=Records([{"name": "Alice"}])))
+
+    assert custom_dict["records.0.name"] == "Alice"
+    assert isinstance(custom_dict["records"], JsonPathObject)
+    custom_dict["records.0"] = {"name": "Bob"}
+    assert custom_dict.to_object() == {"records": [{"name": "Bob"}]}
+
+
+def test_path_keys_are_interned():
+    custom_dict = JsonPathObject()
+    custom_dict["".join(["new", "_key"]) + ".nested"] = 1
+    custom_dict["".join(["other", "_key"])] = 2
+
+    new_key, other_key = custom_dict.keys()
+    assert new_key is sys.intern("new_key")
+    assert other_key is sys.intern("other_key")
+    assert next(iter(custom_dict["new_key"])) is sys.intern("nested")
+
+
+def test_equality():
+    first = JsonPathObject({"a": [1, {"b": 2}], "c": None})
+    second = JsonPathObject({"c": None, "a": [1.0, {"b": 2}]})
+    third = JsonPathObject({"a": [{"b": 2}, 1], "c": None})
+
+    assert first == second
+    assert first != third
+
+    second["a.1.b"] = 3
+    assert first != second
+    first["a.1"]["b"] = 3
+    assert first == second
+
+
+def test_equality_after_shared_data_changes():
+    custom_dict = JsonPathObject({"address": {"city": "New York"}})
+    address = custom_dict["address"]
+    sibling = custom_dict["address"]
+    expected = JsonPathObject({"city": "Los Angeles"})
+
+    assert address != expected
+    custom_dict["address.city"] = "Los Angeles"
+    assert address == expected
+
+    assert sibling != JsonPathObject({"city": "Boston"})
+    address["city"] = "Boston"
+    assert sibling == JsonPathObject({"city": "Boston"})
+
+    assert custom_dict != JsonPathObject({"address": {"city": "Boston"}, "b": 2})
+    custom_dict.data.update(b=2)
+    assert custom_dict == JsonPathObject({"address": {"city": "Boston"}, "b": 2})
+
+
+def test_default_factory_builds_missing_path():
+    custom_dict = JsonPathObject({"items": []}, default_factory=lambda: 0)
+
+    assert custom_dict["items.0.tags.0.count"] == 0
+    assert custom_dict.to_object() == {"items": [{"tags": [{"count": 0}]}]}
+
+    with pytest.raises(IndexError):
+        custom_dict["items.5.name"]
+    assert custom_dict.to_object() == {"items": [{"tags": [{"count": 0}]}]}
+
+    with pytest.raises(IndexError):
+        custom_dict["x.3"]
+    with pytest.raises(IndexError):
+        custom_dict["items.1.tags.2.count"]
+    assert custom_dict.to_object() == {"items": [{"tags": [{"count": 0}]}]}
+
+
+def test_compiled_traverse():
+    core = pytest.importorskip("jsonpath_object._core")
+    data = {"nested_list": [{"name": "Alice"}, {"0": "digit key"}]}
+    steps = JsonPathObject._get_path("nested_list.1.0")
+
+    assert core.traverse(steps, True, "nested_list.1.0", None, frozenset({list}), data, None) == "digit key"
+    assert core.traverse(steps[:1] + (("5", 5),), False, "", None, frozenset({list}), data, None) is None
+    with pytest.raises(IndexError):
+        core.traverse(steps[:1] + (("5", 5),), True, "", None, frozenset({list}), data, None)
+    with pytest.raises(KeyError):
+        core.traverse((("missing", -1),), True, "missing", None, frozenset({list}), data, None)
+
+    wide = "9" * 30
+    wide_steps = JsonPathObject._get_path(f"a.{wide}")
+    assert core.traverse(wide_steps, True, "", None, frozenset({list}), {"a": {wide: 1}}, None) == 1
+
+
+def test_wide_digit_keys():
+    wide = "9" * 30
+    custom_dict = JsonPathObject({"a": {wide: 1}, "scores": [85, 90]})
+
+    assert custom_dict[f"a.{wide}"] == 1
+    assert custom_dict.get(f"a.{wide}") == 1
+    assert custom_dict.get(f"scores.{wide}") is None
+    with pytest.raises(IndexError):
+        custom_dict[f"scores.{wide}"]
+
+
+def test_contains_path():
+    custom_dict = JsonPathObject({"name": "John", "age": 30, "address": {"city": None}, "scores": [85, 90]})
+
+    assert "address.city" in custom_dict
+    assert "scores.1" in custom_dict
+    assert "address.country" not in custom_dict
+    assert "scores.2" not in custom_dict
+    assert "age.value" not in custom_dict
+    assert "name.oh" not in custom_dict
+
+
+def test_missing_key_in_defaultdict():
+    custom_dict = JsonPathObject({"dd": defaultdict(dict)})
+
+    with pytest.raises(KeyError):
+        custom_dict["dd.missing"]
+    assert custom_dict.data["dd"] == {}
+    assert "dd.missing" not in custom_dict
+    assert custom_dict.get("dd.missing") is None
+
+    factory_dict = JsonPathObject({"dd": defaultdict(dict)}, default_factory=lambda: 0)
+    assert factory_dict["dd.missing.count"] == 0
+    assert factory_dict.to_object() == {"dd": {"missing": {"count": 0}}}
+
+
+def test_path_through_scalar():
+    custom_dict = JsonPathObject({"name": "John", "age": 30})
+
+    with pytest.raises(KeyError):
+        custom_dict["age.value"]
+    with pytest.raises(KeyError):
+        custom_dict["name.first"]
+    assert custom_dict.get("age.value", "default") == "default"
+
+
+def test_compact_records():
+    records = [{"name": "Alice", "age": 30}, {"name": "Bob", "age": 25}]
+    custom_dict = JsonPathObject({"people": records})
+    custom_dict.compact("people")
+
+    assert custom_dict["people.1.name"] == "Bob"
+    assert len(custom_dict["people"]) == 2
+    assert custom_dict == JsonPathObject({"people": records})
+
+    custom_dict["people.0.age"] = 31
+    custom_dict["people.1.email"] = "bob@example.com"
+    custom_dict["people"].append({"name": "Carol"})
+    assert "people.2.age" not in custom_dict
+    assert custom_dict.to_object() == {
+        "people": [
+            {"name": "Alice", "age": 31},
+            {"name": "Bob", "age": 25, "email": "bob@example.com"},
+            {"name": "Carol"},
+        ]
+    }
+
+    del custom_dict["people.0"]
+    custom_dict["people"].data.reverse()
+    assert [person["name"] for person in custom_dict["people"]] == ["Carol", "Bob"]
+    assert custom_dict["people"].data.pop() == {"name": "Bob", "age": 25, "email": "bob@example.com"}
+
+
+def test_compact_slices():
+    custom_dict = JsonPathObject({"people": [{"name": name} for name in "ABCDE"]})
+    custom_dict.compact("people")
+    people = custom_dict["people"].data
+
+    assert people[1:3] == [{"name": "B"}, {"name": "C"}]
+    assert people[::-2] == [{"name": "E"}, {"name": "C"}, {"name": "A"}]
+
+    people[1:3] = [{"name": "X", "age": 1}]
+    assert people == [{"name": "A"}, {"name": "X", "age": 1}, {"name": "D"}, {"name": "E"}]
+    people[:] = people[::-1]
+    assert [person["name"] for person in people] == ["E", "D", "X", "A"]
+    with pytest.raises(ValueError):
+        people[::2] = [{"name": "Y"}]
+    with pytest.raises(TypeError):
+        people[:1] = [1]
+
+    del people[::2]
+    assert people == [{"name": "D"}, {"name": "A"}]
+    assert custom_dict.to_object() == {"people": [{"name": "D"}, {"name": "A"}]}
+    with pytest.raises(TypeError):
+        json.dumps(custom_dict.data)
+
+
+def test_compact_copy_keeps_gaps():
+    custom_dict = JsonPathObject({"people": [{"name": "Alice", "age": 30}, {"name": "Bob"}]})
+    custom_dict.compact("people")
+
+    for data in (copy.deepcopy(custom_dict.data), pickle.loads(pickle.dumps(custom_dict.data))):
+        assert data["people"][1] == {"name": "Bob"}
+        assert "age" not in data["people"][1]
+
+
+def test_compact_default_factory():
+    custom_dict = JsonPathObject({"people": []}, default_factory=lambda: "default_value")
+    custom_dict.compact("people")
+
+    assert custom_dict["people.0.name"] == "default_value"
+    assert custom_dict.to_object() == {"people": [{"name": "default_value"}]}
+
+
+def test_compact_requires_records():
+    custom_dict = JsonPathObject({"scores": [85, 90], "name": "John"})
+
+    with pytest.raises(TypeError):
+        custom_dict.compact("scores")
+    with pytest.raises(TypeError):
+        custom_dict.compact("name")
+
+
+def test_internal_wrappers_protocols():
+    from jsonpath_object.core import _JsonPathDict, _JsonPathList
+
+    mapping = _JsonPathDict({"a": {"b": 1}})
+    assert isinstance(mapping, Mapping)
+    assert mapping["a.b"] == 1
+    assert dict(mapping.items()) == {"a": {"b": 1}}
+
+    sequence = _JsonPathList([1, 2, 2])
+    assert isinstance(sequence, Sequence)
+    assert sequence[1] == 2
+    assert list(reversed(sequence)) == [2, 2, 1]
+    assert sequence.index(2) == 1
+    assert sequence.count(2) == 2
+    assert 1 in sequence
+
+
+def test_released_nested_instance_is_reused():
+    custom_dict = JsonPathObject({"address": {"city": "New York"}, "scores": [85, 90]}, raise_on_missing=False)
+
+    with custom_dict["address"] as address:
+        assert address["city"] == "New York"
+    address._release()
+
+    scores = custom_dict["scores"]
+    assert scores is address
+    assert scores[1] == 90
+    assert scores["5"] is None
+    assert custom_dict["address"] is not scores
+
+
+def test_top_level_instance_is_not_released():
+    custom_dict = JsonPathObject({"address": {"city": "New York"}})
+
+    with custom_dict as same:
+        assert same is custom_dict
+    assert custom_dict["address.city"] == "New York"
+    assert custom_dict["address"] is not custom_dict
+
+
+def test_repr_after_releasing_intermediate_instance():
+    custom_dict = JsonPathObject({"a": {"b": {"c": 1}}})
+    assert repr(custom_dict) == "{'a': {'b': {'c': 1}}}"
+
+    with custom_dict["a"] as a:
+        b = a["b"]
+    b["c"] = 2
+    assert repr(custom_dict) == "{'a': {'b': {'c': 2}}}"